@@ -93,7 +93,14 @@ sleep 2
 # 启动Web服务
 echo "启动Web服务..."
 cd src/web
-python3 app.py > ../../logs/web.log 2>&1 &
+python3 -c "from app import init_database; init_database()"
+if command -v gunicorn &> /dev/null; then
+    # 生产环境使用gunicorn多进程多线程运行，配置见 src/web/gunicorn.conf.py
+    gunicorn -c gunicorn.conf.py app:app > ../../logs/web.log 2>&1 &
+else
+    echo "警告: 未找到gunicorn，使用Flask开发服务器"
+    python3 app.py > ../../logs/web.log 2>&1 &
+fi
 WEB_PID=$!
 cd ../..
 echo "Web服务已启动 (PID: $WEB_PID)"
@@ -28,7 +28,7 @@ fi
 
 # 检查是否还有相关进程在运行
 echo "检查剩余进程..."
-PIDS=$(ps aux | grep -E "(plc-simulator|app.py)" | grep -v grep | awk '{print $2}')
+PIDS=$(ps aux | grep -E "(plc-simulator|app.py|gunicorn.*app:app)" | grep -v grep | awk '{print $2}')
 
 if [ -n "$PIDS" ]; then
     echo "发现剩余进程，正在强制停止..."
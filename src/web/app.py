@@ -18,16 +18,42 @@
 - RESTful API接口
 """
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, render_template, jsonify, request, g, Response
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 import json
+import math
+import orjson
 import sqlite3
 import os
-from datetime import datetime, timedelta
-import pandas as pd
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from functools import lru_cache
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    基于orjson的JSON序列化器
+
+    功能说明：
+    替换Flask默认的json模块实现，jsonify等接口会自动通过该类完成编码，
+    大数据量接口（如设备数据查询、统计信息）的序列化速度显著提升
+    """
+
+    # orjson序列化选项：支持numpy类型、非字符串键，无时区时间按UTC处理
+    OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 # 创建Flask应用实例
 app = Flask(__name__)
+# 使用orjson作为JSON序列化器
+app.json = ORJSONProvider(app)
 # 启用CORS支持，允许跨域请求
 CORS(app)
 
@@ -37,9 +63,140 @@ CORS(app)
 CONFIG_FILE = '../../config/config.json'
 # 数据库文件路径
 DATABASE_PATH = '../../data/plc_data.db'
+# 读连接池大小
+READ_POOL_SIZE = 8
+
+# 设备数据查询语句：分为"全部类型"和"指定类型"两种形式，
+# 使用固定的SQL文本以便命中sqlite3的预编译语句缓存。
+# 时间边界为datetime(参考时间, 偏移量)，参考时间在一次请求内保持不变
+DEVICE_DATA_QUERY = '''
+    SELECT timestamp, data_type, value, unit, source
+    FROM device_data
+    WHERE device_name = ? AND timestamp >= datetime(?, ?)
+    ORDER BY timestamp DESC
+    LIMIT ?
+'''
+DEVICE_DATA_BY_TYPE_QUERY = '''
+    SELECT timestamp, data_type, value, unit, source
+    FROM device_data
+    WHERE device_name = ? AND data_type = ? AND timestamp >= datetime(?, ?)
+    ORDER BY timestamp DESC
+    LIMIT ?
+'''
+# 分批查询更早时间窗口 [下界, 上界) 的语句
+DEVICE_DATA_WINDOW_QUERY = '''
+    SELECT timestamp, data_type, value, unit, source
+    FROM device_data
+    WHERE device_name = ?
+      AND timestamp >= datetime(?, ?) AND timestamp < datetime(?, ?)
+    ORDER BY timestamp DESC
+    LIMIT ?
+'''
+DEVICE_DATA_BY_TYPE_WINDOW_QUERY = '''
+    SELECT timestamp, data_type, value, unit, source
+    FROM device_data
+    WHERE device_name = ? AND data_type = ?
+      AND timestamp >= datetime(?, ?) AND timestamp < datetime(?, ?)
+    ORDER BY timestamp DESC
+    LIMIT ?
+'''
+# 实时数据查询语句：单个传感器类型最近的10个数据点，多个类型用UNION ALL拼接
+REALTIME_SENSOR_QUERY = '''
+    SELECT * FROM (
+        SELECT data_type, timestamp, value, unit
+        FROM device_data
+        WHERE data_type = ?
+        ORDER BY timestamp DESC
+        LIMIT 10
+    )
+'''
+# 设备数据分批查询的首个时间窗口（小时），之后每批窗口翻倍
+DEVICE_DATA_BATCH_HOURS = 1
+
+# 数据类型名称映射（中文 -> 英文），统计时同一数据类型的两种名称合并计算
+DATA_TYPE_MAPPING = {
+    '流量': 'flow',
+    '压力': 'pressure',
+    '温度': 'temperature',
+    '状态': 'status'
+}
+# 数据类型统计语句：先按原始数据类型沿idx_dd_type_ts顺序聚合（无需排序），
+# 再对聚合后的少量行做名称映射并合并：平均值按 SUM(总和)/SUM(数量) 重新计算。
+# 最新值不对全表排序：每个原始数据类型在索引上定位一次取最新数据点，
+# 再在映射到同一类型的几行中取时间最新的一行
+DATA_TYPE_STATS_QUERY = '''
+    WITH per_type AS (
+        SELECT
+            CASE d.data_type {cases} ELSE d.data_type END AS data_type,
+            COUNT(*) AS count,
+            SUM(d.value) AS total,
+            MIN(d.value) AS min_value,
+            MAX(d.value) AS max_value,
+            (SELECT MAX(l.timestamp) FROM device_data l
+             WHERE l.data_type = d.data_type) AS latest_ts,
+            (SELECT l.value FROM device_data l
+             WHERE l.data_type = d.data_type
+             ORDER BY l.timestamp DESC LIMIT 1) AS latest_value
+        FROM device_data d
+        GROUP BY d.data_type
+    ),
+    ranked AS (
+        SELECT
+            *,
+            ROW_NUMBER() OVER (
+                PARTITION BY data_type ORDER BY latest_ts DESC
+            ) AS rn
+        FROM per_type
+    )
+    SELECT
+        data_type,
+        SUM(count) as count,
+        SUM(total) / SUM(count) as avg_value,
+        MIN(min_value) as min_value,
+        MAX(max_value) as max_value,
+        MAX(CASE WHEN rn = 1 THEN latest_value END) as latest_value
+    FROM ranked
+    GROUP BY data_type
+'''.format(cases=' '.join(
+    f"WHEN '{name}' THEN '{mapped}'" for name, mapped in DATA_TYPE_MAPPING.items()
+))
+
+# 系统统计信息缓存有效期（秒），不小于仪表板默认轮询间隔（5秒）
+STATS_CACHE_TTL = 5.0
+
+# 由配置文件生成的响应体缓存，键为配置文件修改时间
+_DEVICES_CACHE = {}
+_CONFIG_CACHE = {}
+# 系统统计信息响应体缓存：t为生成时间，body为序列化后的响应体
+_STATS_CACHE = {'t': 0.0, 'body': None}
+# 统计信息刷新锁：缓存过期时只由一个线程重新查询
+_STATS_LOCK = threading.Lock()
+
+# ==================== 数据库连接池 ====================
+
+# 只读连接池，连接在请求之间复用，避免每次请求重复打开数据库文件
+_READ_POOL = queue.Queue(maxsize=READ_POOL_SIZE)
+# 单一写连接及其互斥锁，SQLite同一时刻只允许一个写者
+_WRITE_CONN = None
+_WRITE_LOCK = threading.Lock()
 
 # ==================== 工具函数 ====================
 
+@lru_cache(maxsize=4)
+def _load_config_cached(path, mtime):
+    """
+    读取并解析配置文件（带缓存）
+
+    @param path 配置文件路径
+    @param mtime 配置文件修改时间，作为缓存键的一部分
+    @return dict 配置信息字典
+
+    功能说明：
+    文件修改时间变化后缓存键随之变化，自动重新读取配置文件
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
 def load_config():
     """
     加载系统配置文件
@@ -52,75 +209,228 @@ def load_config():
     - Modbus设备配置
     - Socket设备配置
     - Web服务配置
+
+    注意：返回的字典为缓存对象，调用方不应修改
     """
     try:
-        with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return _load_config_cached(CONFIG_FILE, os.path.getmtime(CONFIG_FILE))
     except FileNotFoundError:
         # 配置文件不存在时返回空字典
         return {}
 
-def get_db_connection():
+def _config_mtime():
+    """
+    获取配置文件修改时间
+
+    @return float 配置文件修改时间，文件不存在时返回None
+    """
+    try:
+        return os.path.getmtime(CONFIG_FILE)
+    except FileNotFoundError:
+        return None
+
+def cached_config_response(cache, build):
     """
-    获取SQLite数据库连接
+    返回由配置文件派生的JSON响应（带缓存）
+
+    @param cache 响应体缓存字典，键为配置文件修改时间
+    @param build 根据配置字典生成响应数据的函数
+    @return Response JSON响应
+
+    功能说明：
+    1. 配置文件未修改时直接返回已序列化的响应体，跳过数据构建和JSON编码
+    2. 根据配置文件修改时间设置ETag和Last-Modified，
+       客户端缓存仍然有效时返回304 Not Modified，不传输响应体
+    """
+    mtime = _config_mtime()
+    body = cache.get(mtime)
+    if body is None:
+        config = _load_config_cached(CONFIG_FILE, mtime) if mtime is not None else {}
+        body = orjson.dumps(build(config), option=ORJSONProvider.OPTIONS)
+        # 只保留当前版本配置对应的缓存
+        cache.clear()
+        cache[mtime] = body
     
-    @return sqlite3.Connection 数据库连接对象
+    response = Response(body, mimetype='application/json')
+    if mtime is not None:
+        response.set_etag(format(int(mtime * 1000000), 'x'))
+        response.last_modified = mtime
+    return response.make_conditional(request)
+
+def build_device_list(config):
+    """
+    根据配置生成设备列表
+
+    @param config 配置信息字典
+    @return list 设备信息列表
+    """
+    devices = []
+    
+    # 检查Modbus设备是否启用
+    if config.get('modbus', {}).get('enabled', False):
+        devices.append({
+            'name': '端子定位检测机',           # 设备名称
+            'type': '定位检测',                 # 设备类型
+            'address': config['modbus']['host'], # 设备地址
+            'port': config['modbus']['port'],    # 设备端口
+            'enabled': True                      # 启用状态
+        })
     
+    # 检查Socket设备是否启用
+    if config.get('socket', {}).get('enabled', False):
+        devices.append({
+            'name': 'D-1夹具机器手臂',           # 设备名称
+            'type': '夹具',                      # 设备类型
+            'address': config['socket']['host'], # 设备地址
+            'port': config['socket']['port'],    # 设备端口
+            'enabled': True                      # 启用状态
+        })
+    
+    return devices
+
+def _open_connection():
+    """
+    创建新的SQLite数据库连接
+
+    @return sqlite3.Connection 数据库连接对象
+
     功能说明：
     1. 确保数据目录存在
-    2. 创建数据库连接
-    3. 设置行工厂为sqlite3.Row，支持列名访问
+    2. 以自动提交模式创建连接，允许跨线程复用
+    3. 设置同步级别、缓存大小等连接级PRAGMA参数
+    4. 设置行工厂为sqlite3.Row，支持列名访问
+
+    连接由连接池复用，PRAGMA参数只在连接创建时设置一次；
+    WAL日志模式保存在数据库文件中，由init_database统一设置
     """
     # 确保数据目录存在
     os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
-    
-    # 创建数据库连接
-    conn = sqlite3.connect(DATABASE_PATH)
+
+    # 创建数据库连接（连接会在线程之间复用，需关闭同线程检查）
+    conn = sqlite3.connect(DATABASE_PATH, check_same_thread=False, isolation_level=None)
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute('PRAGMA temp_store=MEMORY')
+    conn.execute('PRAGMA cache_size=-65536')
+    conn.execute('PRAGMA mmap_size=268435456')
+    conn.execute('PRAGMA busy_timeout=30000')
     # 设置行工厂，支持通过列名访问数据
     conn.row_factory = sqlite3.Row
     return conn
 
+def get_db_connection():
+    """
+    获取SQLite只读数据库连接
+
+    @return sqlite3.Connection 数据库连接对象
+
+    功能说明：
+    1. 同一请求内多次调用返回同一连接
+    2. 优先从连接池中取出空闲连接，池为空时新建连接
+    3. 请求结束时由release_db_connection归还到连接池，调用方无需关闭
+    """
+    if 'db_conn' not in g:
+        try:
+            g.db_conn = _READ_POOL.get_nowait()
+        except queue.Empty:
+            g.db_conn = _open_connection()
+    return g.db_conn
+
+@app.teardown_request
+def release_db_connection(exc):
+    """
+    请求结束时归还数据库连接
+
+    @param exc 请求处理过程中的异常（可能为None）
+
+    功能说明：
+    回滚未完成的事务后将连接放回连接池，连接池已满时直接关闭
+    """
+    conn = g.pop('db_conn', None)
+    if conn is None:
+        return
+    if conn.in_transaction:
+        conn.rollback()
+    try:
+        _READ_POOL.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+@contextmanager
+def get_write_connection():
+    """
+    获取SQLite写连接
+
+    @return sqlite3.Connection 数据库连接对象（上下文管理器）
+
+    功能说明：
+    整个进程共用一个写连接，通过互斥锁串行化所有写操作
+    """
+    global _WRITE_CONN
+    with _WRITE_LOCK:
+        if _WRITE_CONN is None:
+            _WRITE_CONN = _open_connection()
+        yield _WRITE_CONN
+
 def init_database():
     """
     初始化数据库表结构
     
     功能说明：
-    1. 创建设备数据表（device_data）
-    2. 创建设备状态表（device_status）
+    1. 启用WAL日志模式（持久保存在数据库文件中）
+    2. 创建设备数据表（device_data）
+    3. 创建设备状态表（device_status）
+    4. 创建查询所需的索引
     
     表结构说明：
     - device_data: 存储设备产生的数据点
     - device_status: 存储设备状态变化记录
     """
-    conn = get_db_connection()
-    cursor = conn.cursor()
-    
-    # 第一步：创建设备数据表
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS device_data (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,  -- 主键ID
-            timestamp TEXT NOT NULL,               -- 时间戳
-            device_name TEXT NOT NULL,             -- 设备名称
-            data_type TEXT NOT NULL,               -- 数据类型
-            value REAL NOT NULL,                   -- 数据值
-            unit TEXT,                             -- 数据单位
-            source TEXT                            -- 数据源
-        )
-    ''')
-    
-    # 第二步：创建设备状态表
-    cursor.execute('''
-        CREATE TABLE IF NOT EXISTS device_status (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,  -- 主键ID
-            timestamp TEXT NOT NULL,               -- 时间戳
-            device_name TEXT NOT NULL,             -- 设备名称
-            status TEXT NOT NULL                   -- 设备状态
-        )
-    ''')
-    
-    # 提交事务并关闭连接
-    conn.commit()
-    conn.close()
+    with get_write_connection() as conn:
+        cursor = conn.cursor()
+        
+        # 启用WAL日志模式：读操作不再被写操作阻塞，之后打开的连接自动沿用
+        cursor.execute('PRAGMA journal_mode=WAL')
+        
+        # 第一步：创建设备数据表
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS device_data (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,  -- 主键ID
+                timestamp TEXT NOT NULL,               -- 时间戳
+                device_name TEXT NOT NULL,             -- 设备名称
+                data_type TEXT NOT NULL,               -- 数据类型
+                value REAL NOT NULL,                   -- 数据值
+                unit TEXT,                             -- 数据单位
+                source TEXT                            -- 数据源
+            )
+        ''')
+        
+        # 第二步：创建设备状态表
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS device_status (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,  -- 主键ID
+                timestamp TEXT NOT NULL,               -- 时间戳
+                device_name TEXT NOT NULL,             -- 设备名称
+                status TEXT NOT NULL                   -- 设备状态
+            )
+        ''')
+        
+        # 第三步：创建索引，按设备/数据类型过滤并按时间倒序查询时可直接走索引
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_dd_dev_ts
+            ON device_data(device_name, timestamp DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_dd_type_ts
+            ON device_data(data_type, timestamp DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_dd_dev_type_ts
+            ON device_data(device_name, data_type, timestamp DESC)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_ds_dev_ts
+            ON device_status(device_name, timestamp DESC)
+        ''')
 
 # ==================== 页面路由 ====================
 
@@ -160,31 +470,9 @@ def get_devices():
     1. 读取配置文件中的设备信息
     2. 根据配置生成设备列表
     3. 支持Modbus和Socket两种设备类型
+    4. 配置文件未修改时直接返回缓存的响应体
     """
-    config = load_config()
-    devices = []
-    
-    # 检查Modbus设备是否启用
-    if config.get('modbus', {}).get('enabled', False):
-        devices.append({
-            'name': '端子定位检测机',           # 设备名称
-            'type': '定位检测',                 # 设备类型
-            'address': config['modbus']['host'], # 设备地址
-            'port': config['modbus']['port'],    # 设备端口
-            'enabled': True                      # 启用状态
-        })
-    
-    # 检查Socket设备是否启用
-    if config.get('socket', {}).get('enabled', False):
-        devices.append({
-            'name': 'D-1夹具机器手臂',           # 设备名称
-            'type': '夹具',                      # 设备类型
-            'address': config['socket']['host'], # 设备地址
-            'port': config['socket']['port'],    # 设备端口
-            'enabled': True                      # 启用状态
-        })
-    
-    return jsonify(devices)
+    return cached_config_response(_DEVICES_CACHE, build_device_list)
 
 @app.route('/api/data/<device_name>')
 def get_device_data(device_name):
@@ -196,43 +484,50 @@ def get_device_data(device_name):
         
         conn = get_db_connection()
         cursor = conn.cursor()
-        
-        # 构建查询条件
-        where_clause = "WHERE device_name = ?"
-        params = [device_name]
-        
-        if data_type != 'all':
-            where_clause += " AND data_type = ?"
-            params.append(data_type)
-        
-        # 查询指定时间范围内的数据
-        time_limit = datetime.now() - timedelta(hours=hours)
-        where_clause += " AND timestamp >= ?"
-        params.append(time_limit.isoformat())
-        
-        query = f'''
-            SELECT timestamp, data_type, value, unit, source
-            FROM device_data
-            {where_clause}
-            ORDER BY timestamp DESC
-            LIMIT ?
-        '''
-        params.append(limit)
-        
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
-        
+        # 热点循环使用元组按位置取值，不使用sqlite3.Row的列名查找
+        cursor.row_factory = None
+        
+        # 参考时间由SQLite计算，所有批次的时间边界都相对于它，保证窗口首尾相接
+        cursor.execute("SELECT datetime('now')")
+        now = cursor.fetchone()[0]
+        type_params = [] if data_type == 'all' else [data_type]
+        
+        # 按时间窗口由近及远分批查询：第一批为最近DEVICE_DATA_BATCH_HOURS小时，
+        # 之后每批查询 [now-2b, now-b) 的更早窗口，凑满limit条或覆盖hours小时即停止
+        # limit为负数时与SQLite的LIMIT语义一致，表示不限制条数，查询覆盖全部hours小时
+        unlimited = limit < 0
         data = []
-        for row in rows:
-            data.append({
-                'timestamp': row['timestamp'],
-                'type': row['data_type'],
-                'value': row['value'],
-                'unit': row['unit'],
-                'source': row['source']
-            })
+        # 直接迭代游标逐行生成字典，不经过fetchall，结果行列表与字典列表不会同时驻留内存
+        upper = None
+        window = DEVICE_DATA_BATCH_HOURS
+        while True:
+            lower = min(window, hours)
+            remaining = -1 if unlimited else limit - len(data)
+            if upper is None:
+                query = DEVICE_DATA_QUERY if data_type == 'all' else DEVICE_DATA_BY_TYPE_QUERY
+                params = [device_name, *type_params, now, f'-{lower} hours', remaining]
+            else:
+                query = DEVICE_DATA_WINDOW_QUERY if data_type == 'all' else DEVICE_DATA_BY_TYPE_WINDOW_QUERY
+                params = [device_name, *type_params, now, f'-{lower} hours',
+                          now, f'-{upper} hours', remaining]
+            
+            cursor.execute(query, params)
+            data.extend(
+                {
+                    'timestamp': timestamp,
+                    'type': row_type,
+                    'value': value,
+                    'unit': unit,
+                    'source': source
+                }
+                for timestamp, row_type, value, unit, source in cursor
+            )
+            
+            if (not unlimited and len(data) >= limit) or lower >= hours:
+                break
+            upper = lower
+            window *= 2
         
-        conn.close()
         return jsonify(data)
         
     except Exception as e:
@@ -244,6 +539,8 @@ def get_realtime_data(device_name):
     try:
         conn = get_db_connection()
         cursor = conn.cursor()
+        # 热点循环使用元组按位置取值，不使用sqlite3.Row的列名查找
+        cursor.row_factory = None
         
         # 设备名称到传感器类型的映射
         device_sensor_mapping = {
@@ -256,47 +553,27 @@ def get_realtime_data(device_name):
         if not sensor_types:
             return jsonify({'error': f'未知设备: {device_name}'}), 404
         
-        # 获取最新的数据点（按传感器类型查询）
+        # 一次查询获取每种传感器类型最近的10个数据点：
+        # 每种类型一个LIMIT子查询，各自只在idx_dd_type_ts上定位一次，按传感器类型顺序拼接
+        cursor.execute(' UNION ALL '.join([REALTIME_SENSOR_QUERY] * len(sensor_types)), sensor_types)
+        
+        # 单次遍历按传感器类型分组：每组第一行为最新数据点，全部用于图表显示
         latest_values = {}
-        for sensor_type in sensor_types:
-            # 查询该传感器类型的最新数据
-            cursor.execute('''
-                SELECT timestamp, data_type, value, unit, source
-                FROM device_data
-                WHERE data_type = ?
-                ORDER BY timestamp DESC
-                LIMIT 1
-            ''', [sensor_type])
-            
-            row = cursor.fetchone()
-            if row:
+        recent_data = {sensor_type: [] for sensor_type in sensor_types}
+        for sensor_type, timestamp, value, unit in cursor:
+            points = recent_data[sensor_type]
+            if not points:
                 latest_values[sensor_type] = {
-                    'value': row['value'],
-                    'unit': row['unit'],
-                    'timestamp': row['timestamp']
+                    'value': value,
+                    'unit': unit,
+                    'timestamp': timestamp
                 }
+            points.append({
+                'timestamp': timestamp,
+                'value': value,
+                'unit': unit
+            })
         
-        # 获取最近的数据点用于图表显示
-        recent_data = {}
-        for sensor_type in sensor_types:
-            cursor.execute('''
-                SELECT timestamp, data_type, value, unit, source
-                FROM device_data
-                WHERE data_type = ?
-                ORDER BY timestamp DESC
-                LIMIT 10
-            ''', [sensor_type])
-            
-            rows = cursor.fetchall()
-            recent_data[sensor_type] = []
-            for row in rows:
-                recent_data[sensor_type].append({
-                    'timestamp': row['timestamp'],
-                    'value': row['value'],
-                    'unit': row['unit']
-                })
-        
-        conn.close()
         return jsonify({
             'device': device_name,
             'latest': latest_values,
@@ -322,7 +599,6 @@ def get_device_status(device_name):
         ''', [device_name])
         
         row = cursor.fetchone()
-        conn.close()
         
         if row:
             return jsonify({
@@ -342,37 +618,53 @@ def get_analysis(device_name):
         hours = request.args.get('hours', 24, type=int)
         
         conn = get_db_connection()
+        cursor = conn.cursor()
         
-        # 读取数据到DataFrame
-        query = '''
-            SELECT timestamp, data_type, value
-            FROM device_data
-            WHERE device_name = ? AND timestamp >= ?
-            ORDER BY timestamp
-        '''
-        
-        time_limit = datetime.now() - timedelta(hours=hours)
-        df = pd.read_sql_query(query, conn, params=[device_name, time_limit.isoformat()])
-        conn.close()
+        # 在SQL中按数据类型分组聚合，最新值通过窗口函数取出
+        cursor.execute('''
+            WITH ranged AS (
+                SELECT
+                    data_type,
+                    value,
+                    ROW_NUMBER() OVER (
+                        PARTITION BY data_type ORDER BY timestamp DESC
+                    ) AS rn
+                FROM device_data
+                WHERE device_name = ? AND timestamp >= datetime('now', ?)
+            )
+            SELECT
+                data_type,
+                COUNT(*) as count,
+                MIN(value) as min_value,
+                MAX(value) as max_value,
+                AVG(value) as avg_value,
+                SUM(value * value) as sum_sq,
+                MAX(CASE WHEN rn = 1 THEN value END) as latest_value
+            FROM ranged
+            GROUP BY data_type
+        ''', [device_name, f'-{hours} hours'])
+        rows = cursor.fetchall()
         
-        if df.empty:
+        if not rows:
             return jsonify({'error': '没有数据'})
         
-        # 转换时间戳
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        
-        # 按数据类型分组分析
+        # 按数据类型整理分析结果
         analysis = {}
-        for data_type in df['data_type'].unique():
-            type_data = df[df['data_type'] == data_type]
+        for data_type, count, min_value, max_value, mean, sum_sq, latest in rows:
+            # 样本标准差：Var = (Σx² - n·mean²) / (n - 1)，单个数据点时无定义
+            if count > 1:
+                variance = max((sum_sq - count * mean * mean) / (count - 1), 0.0)
+                std = math.sqrt(variance)
+            else:
+                std = None
             
             analysis[data_type] = {
-                'count': len(type_data),
-                'min': float(type_data['value'].min()),
-                'max': float(type_data['value'].max()),
-                'mean': float(type_data['value'].mean()),
-                'std': float(type_data['value'].std()),
-                'latest': float(type_data['value'].iloc[-1]) if not type_data.empty else 0
+                'count': count,
+                'min': float(min_value),
+                'max': float(max_value),
+                'mean': float(mean),
+                'std': std,
+                'latest': float(latest)
             }
         
         return jsonify(analysis)
@@ -383,115 +675,93 @@ def get_analysis(device_name):
 @app.route('/api/config')
 def get_config():
     """获取系统配置"""
-    config = load_config()
-    return jsonify(config)
+    return cached_config_response(_CONFIG_CACHE, lambda config: config)
+
+def _query_system_stats():
+    """
+    查询系统统计信息
+
+    @return dict 统计信息字典
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    
+    # 一次往返获取总数据点数量、设备数量和最新数据时间：
+    # 各自作为独立的标量子查询，保留COUNT(*)快速计数、按device_name索引去重计数
+    # 和按timestamp索引定位最大值的优化，合并成一条聚合语句反而需要临时B树
+    cursor.execute('''
+        SELECT
+            (SELECT COUNT(*) FROM device_data) as total_data_points,
+            (SELECT COUNT(DISTINCT device_name) FROM device_data) as device_count,
+            (SELECT MAX(timestamp) FROM device_data) as latest_timestamp
+    ''')
+    total_data_points, device_count, latest_timestamp = cursor.fetchone()
+    
+    # 获取数据类型统计 - 改进为更有意义的信息
+    # 中文名称在SQL中映射为英文名称后再分组，无需在Python中合并
+    cursor.execute(DATA_TYPE_STATS_QUERY)
+    
+    data_type_stats = {}
+    for row in cursor.fetchall():
+        data_type_stats[row[0]] = {
+            'count': row[1],
+            'avg_value': round(row[2], 2) if row[2] else 0,
+            'min_value': round(row[3], 2) if row[3] else 0,
+            'max_value': round(row[4], 2) if row[4] else 0,
+            'latest_value': round(row[5], 2) if row[5] else 0
+        }
+    
+    # 获取设备状态统计
+    cursor.execute('''
+        SELECT device_name, status, COUNT(*) as count
+        FROM device_status
+        WHERE timestamp >= datetime('now', '-1 hour')
+        GROUP BY device_name, status
+    ''')
+    status_stats = {}
+    for row in cursor.fetchall():
+        device = row[0]
+        status = row[1]
+        count = row[2]
+        if device not in status_stats:
+            status_stats[device] = {}
+        status_stats[device][status] = count
+    
+    return {
+        'total_data_points': total_data_points,
+        'device_count': device_count,
+        'data_type_stats': data_type_stats,
+        'latest_timestamp': latest_timestamp,
+        'status_stats': status_stats,
+        'system_uptime': '运行中'
+    }
 
 @app.route('/api/stats')
 def get_system_stats():
     """获取系统统计信息"""
+    # 仪表板轮询频繁，有效期内直接返回缓存的统计结果
+    body = _STATS_CACHE['body']
+    if body is not None and time.monotonic() - _STATS_CACHE['t'] < STATS_CACHE_TTL:
+        return Response(body, mimetype='application/json')
+    
+    # 缓存过期时只允许一个线程刷新，其他线程继续返回旧的统计结果；
+    # 尚无缓存时等待正在进行的刷新完成
+    if not _STATS_LOCK.acquire(blocking=body is None):
+        return Response(body, mimetype='application/json')
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        
-        # 获取总数据点数量
-        cursor.execute('SELECT COUNT(*) FROM device_data')
-        total_data_points = cursor.fetchone()[0]
+        # 等待锁期间其他线程可能已完成刷新
+        if _STATS_CACHE['body'] is not None and time.monotonic() - _STATS_CACHE['t'] < STATS_CACHE_TTL:
+            return Response(_STATS_CACHE['body'], mimetype='application/json')
         
-        # 获取设备数量
-        cursor.execute('SELECT COUNT(DISTINCT device_name) FROM device_data')
-        device_count = cursor.fetchone()[0]
-        
-        # 获取数据类型统计 - 改进为更有意义的信息
-        cursor.execute('''
-            SELECT 
-                data_type,
-                COUNT(*) as count,
-                AVG(value) as avg_value,
-                MIN(value) as min_value,
-                MAX(value) as max_value,
-                (SELECT value FROM device_data 
-                 WHERE data_type = d.data_type 
-                 ORDER BY timestamp DESC LIMIT 1) as latest_value
-            FROM device_data d
-            GROUP BY data_type
-        ''')
-        
-        # 数据类型名称映射（中文 -> 英文）
-        data_type_mapping = {
-            '流量': 'flow',
-            '压力': 'pressure', 
-            '温度': 'temperature',
-            '状态': 'status'
-        }
-        
-        data_type_stats = {}
-        for row in cursor.fetchall():
-            data_type = row[0]
-            # 如果是中文名称，映射到英文名称
-            if data_type in data_type_mapping:
-                data_type = data_type_mapping[data_type]
-            
-            # 如果该数据类型已存在，合并统计数据
-            if data_type in data_type_stats:
-                existing = data_type_stats[data_type]
-                # 合并计数
-                existing['count'] += row[1]
-                # 重新计算平均值（加权平均）
-                total_count = existing['count']
-                existing['avg_value'] = round(
-                    (existing['avg_value'] * (total_count - row[1]) + row[2] * row[1]) / total_count, 2
-                )
-                # 更新最小值和最大值
-                existing['min_value'] = min(existing['min_value'], row[3])
-                existing['max_value'] = max(existing['max_value'], row[4])
-                # 使用最新的值
-                existing['latest_value'] = row[5]
-            else:
-                # 新的数据类型，直接添加
-                data_type_stats[data_type] = {
-                    'count': row[1],
-                    'avg_value': round(row[2], 2) if row[2] else 0,
-                    'min_value': round(row[3], 2) if row[3] else 0,
-                    'max_value': round(row[4], 2) if row[4] else 0,
-                    'latest_value': round(row[5], 2) if row[5] else 0
-                }
-        
-        # 获取最新数据时间
-        cursor.execute('''
-            SELECT MAX(timestamp) as latest_timestamp
-            FROM device_data
-        ''')
-        latest_timestamp = cursor.fetchone()[0]
-        
-        # 获取设备状态统计
-        cursor.execute('''
-            SELECT device_name, status, COUNT(*) as count
-            FROM device_status
-            WHERE timestamp >= datetime('now', '-1 hour')
-            GROUP BY device_name, status
-        ''')
-        status_stats = {}
-        for row in cursor.fetchall():
-            device = row[0]
-            status = row[1]
-            count = row[2]
-            if device not in status_stats:
-                status_stats[device] = {}
-            status_stats[device][status] = count
-        
-        conn.close()
-        
-        return jsonify({
-            'total_data_points': total_data_points,
-            'device_count': device_count,
-            'data_type_stats': data_type_stats,
-            'latest_timestamp': latest_timestamp,
-            'status_stats': status_stats,
-            'system_uptime': '运行中'
-        })
+        body = orjson.dumps(_query_system_stats(), option=ORJSONProvider.OPTIONS)
+        _STATS_CACHE['body'] = body
+        _STATS_CACHE['t'] = time.monotonic()
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+    finally:
+        _STATS_LOCK.release()
 
 if __name__ == '__main__':
     # 初始化数据库
@@ -501,7 +771,9 @@ if __name__ == '__main__':
     config = load_config()
     host = config.get('web', {}).get('host', '0.0.0.0')  # 允许外部访问
     port = config.get('web', {}).get('port', 5000)
-    debug = config.get('web', {}).get('debug', True)
+    # 调试模式默认关闭，可通过环境变量FLASK_DEBUG临时开启
+    debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true', 'yes') \
+        or config.get('web', {}).get('debug', False)
     
     print(f"启动Web服务: http://{host}:{port}")
     print(f"本地访问: http://127.0.0.1:{port}")
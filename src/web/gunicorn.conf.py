@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+工业设备数据模拟系统 - Web服务gunicorn配置
+
+@file gunicorn.conf.py
+@brief gunicorn生产环境运行配置
+@details 监听地址从系统配置文件读取，按CPU核数启动多进程多线程工作者
+
+使用方法（在src/web目录下）：
+    python3 -c "from app import init_database; init_database()"
+    gunicorn -c gunicorn.conf.py app:app
+"""
+
+import json
+import multiprocessing
+
+# 读取系统配置中的Web服务监听地址
+try:
+    with open('../../config/config.json', 'r', encoding='utf-8') as f:
+        _web_config = json.load(f).get('web', {})
+except FileNotFoundError:
+    _web_config = {}
+
+# 监听地址
+bind = f"{_web_config.get('host', '0.0.0.0')}:{_web_config.get('port', 5000)}"
+# 工作进程数：每个CPU核一个进程
+workers = multiprocessing.cpu_count()
+# 线程工作模式：每个进程8个线程，与数据库读连接池大小一致
+worker_class = 'gthread'
+threads = 8